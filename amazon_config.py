@@ -5,6 +5,7 @@ Proper extension of driver configuration with Amazon-specific settings.
 """
 
 import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 from pydantic import Field
@@ -37,6 +38,8 @@ class ParserSettings(BaseSettings):
         extra="ignore",
         env_prefix="UNREALON_",
         case_sensitive=False,
+        env_ignore_empty=True,
+        validate_default=False,
     )
 
     # System Paths
@@ -51,6 +54,7 @@ class ParserSettings(BaseSettings):
     # Runtime Limits
     LLM_DAILY_LIMIT: float = Field(default=1.0)
     MAX_PAGES: int = Field(default=2)
+    DEFAULT_QUERY: str = Field(default="laptop")
 
     # Browser Settings
     BROWSER_HEADLESS: bool = Field(default=False)
@@ -62,8 +66,11 @@ class ParserSettings(BaseSettings):
     LOG_TO_FILE: bool = Field(default=True)
 
 
-# 🔥 Load Amazon settings globally
-parser_settings = ParserSettings()
+# 🔥 Load Amazon settings once, on first use
+@lru_cache(maxsize=1)
+def get_parser_settings() -> ParserSettings:
+    """Amazon settings, parsed from config.env on first call."""
+    return ParserSettings()
 
 
 class AmazonAutoConfig(AutoConfig):
@@ -90,10 +97,11 @@ class AmazonAutoConfig(AutoConfig):
     def _create_browser_config(self):
         """Override browser config with Amazon + STEALTH settings."""
         # 🔥 CREATE FRESH CONFIG with Amazon settings from config.env
+        settings = get_parser_settings()
         return DriverBrowserConfig(
             parser_id=self.parser_id,
-            headless=parser_settings.BROWSER_HEADLESS,  # From config.env!
-            timeout=parser_settings.BROWSER_TIMEOUT,  # From config.env!
+            headless=settings.BROWSER_HEADLESS,  # From config.env!
+            timeout=settings.BROWSER_TIMEOUT,  # From config.env!
             user_data_dir=str(SYSTEM_DIR),
             page_load_strategy="normal",
             wait_for_selector_timeout=10,
@@ -102,7 +110,7 @@ class AmazonAutoConfig(AutoConfig):
             enable_images=True,
             enable_css=True,
             debug_mode=False,
-            save_screenshots=parser_settings.SAVE_SCREENSHOTS,  # From config.env!
+            save_screenshots=settings.SAVE_SCREENSHOTS,  # From config.env!
         )
 
     def _create_llm_config(self):
@@ -112,17 +120,18 @@ class AmazonAutoConfig(AutoConfig):
         # 🔥 FORCE Amazon LLM settings from config.env
         config.provider = "openrouter"
         config.model = "anthropic/claude-3.5-sonnet"
-        config.api_key = parser_settings.OPENROUTER_API_KEY  # From config.env!
+        config.api_key = get_parser_settings().OPENROUTER_API_KEY  # From config.env!
         config.enable_caching = True
 
         return config
 
     def _create_daemon_config(self):
         """Override daemon config with Amazon-specific settings."""
+        settings = get_parser_settings()
 
         return DaemonModeConfig(
-            server_url=parser_settings.SERVER_URL,
-            api_key=parser_settings.API_KEY,
+            server_url=settings.SERVER_URL,
+            api_key=settings.API_KEY,
             auto_reconnect=True,
             connection_timeout=30,
             heartbeat_interval=30,  # Heartbeat every 30 seconds
@@ -132,5 +141,17 @@ class AmazonAutoConfig(AutoConfig):
         )
 
 
-# Global Amazon config instance
-amazon_config = AmazonAutoConfig()
+# Global Amazon config instance, created on first use
+@lru_cache(maxsize=1)
+def get_amazon_config() -> AmazonAutoConfig:
+    """Shared Amazon config, created on first call."""
+    return AmazonAutoConfig()
+
+
+def __getattr__(name: str):
+    """Resolve legacy ``parser_settings`` / ``amazon_config`` globals lazily."""
+    if name == "parser_settings":
+        return get_parser_settings()
+    if name == "amazon_config":
+        return get_amazon_config()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -2,13 +2,15 @@
 Amazon Product Models - Pydantic data models for Amazon products
 """
 
-from typing import List, Optional, Dict, Any
-from pydantic import BaseModel, Field
+from typing import List, Optional, Dict, Any, Tuple, Union
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class AmazonPrice(BaseModel):
     """Amazon product price model."""
 
+    model_config = ConfigDict(frozen=True)
+
     current: Optional[float] = Field(default=None, description="Current price")
     original: Optional[float] = Field(default=None, description="Original price")
     currency: str = Field(default="USD", description="Price currency")
@@ -20,6 +22,8 @@ class AmazonPrice(BaseModel):
 class AmazonRating(BaseModel):
     """Amazon product rating model."""
 
+    model_config = ConfigDict(frozen=True)
+
     rating: Optional[float] = Field(default=None, description="Product rating (1-5)")
     review_count: Optional[int] = Field(default=None, description="Number of reviews")
     rating_text: Optional[str] = Field(default=None, description="Rating text")
@@ -28,6 +32,8 @@ class AmazonRating(BaseModel):
 class AmazonImage(BaseModel):
     """Amazon product image model."""
 
+    model_config = ConfigDict(frozen=True)
+
     url: str = Field(description="Image URL")
     alt_text: Optional[str] = Field(default=None, description="Image alt text")
     is_primary: bool = Field(default=False, description="Is primary image")
@@ -36,6 +42,8 @@ class AmazonImage(BaseModel):
 class AmazonProduct(BaseModel):
     """Amazon product model."""
 
+    model_config = ConfigDict(frozen=True)
+
     asin: str = Field(description="Amazon Standard Identification Number")
     title: str = Field(description="Product title")
     price: Optional[AmazonPrice] = Field(default=None, description="Product price")
@@ -43,10 +51,8 @@ class AmazonProduct(BaseModel):
     availability: Optional[str] = Field(
         default=None, description="Product availability"
     )
-    images: List[AmazonImage] = Field(
-        default_factory=list, description="Product images"
-    )
-    features: List[str] = Field(default_factory=list, description="Product features")
+    images: Tuple[AmazonImage, ...] = Field(default=(), description="Product images")
+    features: Tuple[str, ...] = Field(default=(), description="Product features")
     description: Optional[str] = Field(default=None, description="Product description")
     specifications: Dict[str, Any] = Field(
         default_factory=dict, description="Product specifications"
@@ -58,6 +64,17 @@ class AmazonProduct(BaseModel):
     prime_eligible: bool = Field(default=False, description="Prime eligible")
     free_shipping: bool = Field(default=False, description="Free shipping available")
 
+    def __hash__(self) -> int:
+        # specifications is a plain dict and unhashable; leaving it out keeps
+        # the hash consistent with __eq__, which still compares it
+        return hash(
+            tuple(
+                getattr(self, name)
+                for name in type(self).model_fields
+                if name != "specifications"
+            )
+        )
+
 
 class AmazonSearchResult(BaseModel):
     """Amazon search result model."""
@@ -79,8 +96,8 @@ class AmazonExtractionResult(BaseModel):
     """Amazon extraction result model."""
 
     success: bool = Field(description="Extraction success status")
-    data: Optional[AmazonSearchResult] = Field(
-        default=None, description="Extracted data"
+    data: Optional[Union[AmazonSearchResult, Dict[str, Any]]] = Field(
+        default=None, description="Search results or product details"
     )
     cost_usd: float = Field(default=0.0, description="LLM cost in USD")
     processing_time: float = Field(
@@ -1,17 +1,25 @@
 """
-Amazon Catalog Parser - Full catalog parser with BeautifulSoup (NO LLM)
+Amazon Catalog Parser - Full catalog parser with lxml (NO LLM)
 """
 
 import asyncio
 import re
 import time
-from typing import Dict, Any
-from bs4 import BeautifulSoup
+from collections import OrderedDict
+from typing import Dict, Any, Callable, Optional, Tuple
+import lxml.html
+from cssselect import HTMLTranslator
+from lxml import etree
 
 from unrealon_driver.src.core.parser import Parser
 from unrealon_driver.src.cli.simple import SimpleParser
 
-from amazon_config import amazon_config, parser_instance_config
+from amazon_config import (
+    get_amazon_config,
+    get_parser_settings,
+    parser_instance_config,
+)
+from extractor.simple_extractor import clean_amazon_url
 from catalog.models import (
     AmazonProduct,
     AmazonSearchResult,
@@ -22,45 +30,314 @@ from catalog.models import (
 )
 
 
+_css_translator = HTMLTranslator()
+
+
+def _compile_selectors(*selectors: str) -> Tuple[etree.XPath, ...]:
+    """Compile CSS fallback selectors into XPaths returning the first match."""
+    return tuple(
+        etree.XPath(
+            f"({_css_translator.css_to_xpath(selector, prefix='descendant::')})[1]"
+        )
+        for selector in selectors
+    )
+
+
+def _compile_any(*selectors: str) -> etree.XPath:
+    """Compile CSS selectors into one XPath testing whether any of them match."""
+    group = ", ".join(selectors)
+    return etree.XPath(
+        f"boolean({_css_translator.css_to_xpath(group, prefix='descendant::')})"
+    )
+
+
+# Numeric patterns used per product, compiled once
+PRICE_RE = re.compile(r"[\d,]+\.?\d*")
+RATING_RE = re.compile(r"(\d+\.?\d*)")
+COUNT_RE = re.compile(r"([\d,]+)")
+PRICE_STRIP_TABLE = str.maketrans("", "", "$,")
+
+# Listing pages are fed to the streaming parser in chunks of this many chars
+PARSE_CHUNK_SIZE = 64 * 1024
+
+# Fallback selectors from original parser, compiled once at import
+TITLE_SELECTORS = _compile_selectors(
+    "h2.a-size-medium a span",
+    ".s-line-clamp-2 span",
+    "h2 span",
+    ".a-link-normal .a-text-normal span",
+    "h2 a span",
+    "h2 a",  # Fallback for direct link
+    ".a-size-medium.a-color-base.a-text-normal",  # Direct text
+)
+PRICE_SELECTORS = _compile_selectors(
+    ".a-price .a-offscreen",
+    ".a-price-whole",
+    ".puis-price-instructions-style .a-price",
+    ".a-price-range .a-offscreen",  # Price range
+    ".a-price .a-price-whole",  # Whole price
+    ".a-price .a-price-fraction",  # Fraction part
+)
+RATING_SELECTORS = _compile_selectors(
+    ".a-icon-star-mini .a-icon-alt",
+    ".a-icon-star .a-icon-alt",
+    ".a-popover-trigger .a-icon-alt",
+    ".a-icon-alt",  # General star icon
+    ".a-star-mini .a-icon-alt",  # Mini star
+)
+IMAGE_SELECTORS = _compile_selectors(
+    ".s-image",
+    ".s-product-image-container img",
+    "img.s-image",
+    ".s-image-container img",  # Alternative container
+    "img[data-image-latency]",  # Data attribute
+)
+REVIEW_COUNT_SELECTORS = _compile_selectors(
+    ".s-link-style .a-size-base",
+    ".a-size-base.s-link-style",
+    ".a-size-base",
+    ".a-link-normal .a-size-base",
+)
+AVAILABILITY_SELECTORS = _compile_selectors(
+    ".a-size-base.a-color-secondary",
+    ".a-size-base.a-color-price",
+    ".a-color-secondary",
+)
+# Prime only needs existence, so its fallbacks are matched as one union
+PRIME_XPATH = _compile_any(
+    ".a-icon-prime",
+    ".s-prime",
+    "[data-prime]",
+)
+
+# Product details page
+DETAILS_TITLE_SELECTORS = _compile_selectors("#productTitle")
+DETAILS_PRICE_SELECTORS = _compile_selectors(".a-price .a-offscreen")
+
+
+def _first_match(
+    container, selectors: Tuple[etree.XPath, ...], pick: Callable[[Any], Any]
+) -> Any:
+    """Return the first value picked from selector matches, in priority order."""
+    for selector in selectors:
+        found = selector(container)
+        if found:
+            value = pick(found[0])
+            if value is not None:
+                return value
+    return None
+
+
+def _text(element) -> Optional[str]:
+    """Stripped text of an element and its descendants."""
+    return "".join(part.strip() for part in element.itertext()) or None
+
+
+def _src(element) -> Optional[str]:
+    """Image source attribute."""
+    return element.get("src") or None
+
+
+def _rating(element) -> Optional[float]:
+    """Rating from "4.5 out of 5 stars" aria-label."""
+    aria_label = element.get("aria-label")
+    if aria_label:
+        match = RATING_RE.search(aria_label)
+        if match:
+            return float(match.group(1))
+    return None
+
+
+def _review_count(element) -> Optional[int]:
+    """Review count from text like "1,234" or "1,234 reviews"."""
+    match = COUNT_RE.search(_text(element) or "")
+    if match:
+        return int(match.group(1).replace(",", ""))
+    return None
+
+
+def _availability(element) -> Optional[str]:
+    """Short availability status text."""
+    text = _text(element)
+    if text and len(text) < 50:  # Avoid long descriptions
+        return text
+    return None
+
+
+# Listing fields of a search-result container: (name, selectors, picker)
+FIELD_EXTRACTORS = (
+    ("title", TITLE_SELECTORS, _text),
+    ("price", PRICE_SELECTORS, _text),
+    ("rating", RATING_SELECTORS, _rating),
+    ("review_count", REVIEW_COUNT_SELECTORS, _review_count),
+    ("image", IMAGE_SELECTORS, _src),
+    ("availability", AVAILABILITY_SELECTORS, _availability),
+)
+
+
+def _extract_fields(container) -> Dict[str, Any]:
+    """Fill all listing fields of a search-result container from FIELD_EXTRACTORS.
+
+    Table-driven rather than a single pass: each field runs its own fallback
+    chain in priority order.
+    """
+    fields = {
+        name: _first_match(container, selectors, pick)
+        for name, selectors, pick in FIELD_EXTRACTORS
+    }
+    fields["prime"] = PRIME_XPATH(container)
+    return fields
+
+
+def _iter_search_results(html_content: str):
+    """Stream-parse a listing page, yielding search-result containers.
+
+    Containers are yielded as soon as they close, so the full page tree is
+    never held in memory at once.
+    """
+    parser = etree.HTMLPullParser(events=("end",), tag="div")
+
+    for offset in range(0, len(html_content), PARSE_CHUNK_SIZE):
+        parser.feed(html_content[offset : offset + PARSE_CHUNK_SIZE])
+        yield from _drain_search_results(parser)
+
+    parser.close()
+    yield from _drain_search_results(parser)
+
+
+def _drain_search_results(parser: etree.HTMLPullParser):
+    """Yield closed search-result containers, freeing each once processed."""
+    for _, element in parser.read_events():
+        if element.get("data-component-type") != "s-search-result":
+            continue
+
+        yield element
+
+        # Drop the processed container and the siblings parsed before it
+        element.clear()
+        parent = element.getparent()
+        while element.getprevious() is not None:
+            del parent[0]
+
+
 class AmazonCatalogParser(Parser):
-    """Full Amazon catalog parser with BeautifulSoup (NO LLM)."""
+    """Full Amazon catalog parser with lxml (NO LLM)."""
+
+    # Fetched pages are reused for re-runs of the same URL within the TTL
+    HTML_CACHE_SIZE = 64
+    HTML_CACHE_TTL = 300.0
+
+    # Extracted details are reused when the same page content comes back
+    DETAILS_MEMO_SIZE = 128
+
+    # Search pages fetched at once. Kept at 1 until the driver's get_html is
+    # confirmed safe to call concurrently on the shared browser profile
+    PAGE_CONCURRENCY = 1
 
     def __init__(self):
         super().__init__(
             parser_id=parser_instance_config.parser_id,
-            parser_name="Amazon Catalog Parser (BeautifulSoup)",
-            config=amazon_config,
+            parser_name="Amazon Catalog Parser (lxml)",
+            config=get_amazon_config(),
         )
         self.results = []
         self._operation_timer = None
         self._start_time = time.time()
+        self._html_cache: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+        self._details_memo: "OrderedDict[int, Dict[str, Any]]" = OrderedDict()
+
+        # Scheduled run settings, bound once from config.env
+        settings = get_parser_settings()
+        self._max_pages = settings.MAX_PAGES
+        self._default_query = settings.DEFAULT_QUERY
 
     async def setup(self):
         """Setup parser with logging."""
         self.logger.info("🚀 Amazon Catalog Parser initialized (NO LLM)")
 
+    async def _cached_get_html(self, url: str, ttl: float = HTML_CACHE_TTL) -> str:
+        """Get page HTML via browser service, cached by clean URL (LRU + TTL)."""
+        key = clean_amazon_url(url)
+        cached = self._html_cache.get(key)
+        if cached is not None and time.monotonic() - cached[0] < ttl:
+            self._html_cache.move_to_end(key)
+            self.logger.debug(f"Using cached HTML for {key}")
+            return cached[1]
+
+        html_content = await self.browser.get_html(url)
+        if html_content:
+            self._html_cache[key] = (time.monotonic(), html_content)
+            self._html_cache.move_to_end(key)
+            while len(self._html_cache) > self.HTML_CACHE_SIZE:
+                self._html_cache.popitem(last=False)
+
+        return html_content
+
+    async def _fetch_and_parse_page(
+        self,
+        query: str,
+        page: int,
+        semaphore: asyncio.Semaphore,
+        last_page: Dict[str, int],
+    ) -> list:
+        """Fetch a single search page and extract its products.
+
+        ``last_page["page"]`` is lowered to the first empty or failed page seen,
+        so pages past it that have not started fetching yet are skipped.
+        """
+        search_url = f"https://www.amazon.com/s?k={query}&page={page}"
+
+        try:
+            async with semaphore:
+                if page > last_page["page"]:
+                    return []
+
+                self.logger.info(f"📄 Processing page {page}: {search_url}")
+
+                # Get HTML content using browser service (cached)
+                html_content = await self._cached_get_html(search_url)
+
+            # Stream-parse with lxml and extract products using compiled
+            # selectors; isspace() avoids copying the page just to test it
+            products = (
+                self._extract_products_from_html(html_content)
+                if html_content and not html_content.isspace()
+                else []
+            )
+        except BaseException:
+            last_page["page"] = min(last_page["page"], page)
+            raise
+
+        if not products:
+            last_page["page"] = min(last_page["page"], page)
+        return products
+
     async def search_products(
         self, query: str, max_pages: int = 2
     ) -> AmazonExtractionResult:
-        """Search for products with pagination using BeautifulSoup."""
+        """Search for products with pagination using lxml."""
         try:
             self.logger.info(f"🔍 Searching for: {query}")
 
             all_products = []
-            start_time = asyncio.get_event_loop().time()
-
-            for page in range(1, max_pages + 1):
-                search_url = f"https://www.amazon.com/s?k={query}&page={page}"
-                self.logger.info(f"📄 Processing page {page}: {search_url}")
-
-                # Get HTML content directly using browser service
-                html_content = await self.browser.get_html(search_url)
+            start_time = time.perf_counter()
+
+            # Pages are fetched in order, up to PAGE_CONCURRENCY at a time
+            semaphore = asyncio.Semaphore(self.PAGE_CONCURRENCY)
+            last_page = {"page": max_pages}
+            pages = await asyncio.gather(
+                *(
+                    self._fetch_and_parse_page(query, page, semaphore, last_page)
+                    for page in range(1, max_pages + 1)
+                ),
+                return_exceptions=True,
+            )
 
-                # Parse with BeautifulSoup
-                soup = BeautifulSoup(html_content, "html.parser")
+            # Keep sequential semantics: stop at the first empty page
+            for page, page_products in enumerate(pages, start=1):
+                if isinstance(page_products, BaseException):
+                    raise page_products
 
-                # Extract products using selectors
-                page_products = self._extract_products_from_soup(soup)
                 all_products.extend(page_products)
 
                 self.logger.info(f"✅ Page {page}: Found {len(page_products)} products")
@@ -69,17 +346,17 @@ class AmazonCatalogParser(Parser):
                     self.logger.warning(f"⚠️ Page {page}: No products found")
                     break
 
-            processing_time = asyncio.get_event_loop().time() - start_time
+            processing_time = time.perf_counter() - start_time
 
-            # Create search result
-            search_result = AmazonSearchResult(
+            # Create search result (trusted data, skip validation)
+            search_result = AmazonSearchResult.model_construct(
                 query=query,
                 total_results=len(all_products),
                 products=all_products,
                 search_url=f"https://www.amazon.com/s?k={query}",
             )
 
-            return AmazonExtractionResult(
+            return AmazonExtractionResult.model_construct(
                 success=True,
                 data=search_result,
                 cost_usd=0.0,  # No LLM cost
@@ -98,23 +375,20 @@ class AmazonCatalogParser(Parser):
             )
 
     async def get_product_details(self, asin: str) -> AmazonExtractionResult:
-        """Get detailed product information by ASIN using BeautifulSoup."""
+        """Get detailed product information by ASIN using lxml."""
         try:
             product_url = f"https://www.amazon.com/dp/{asin}"
             self.logger.info(f"📦 Getting details for ASIN: {asin}")
 
-            start_time = asyncio.get_event_loop().time()
-
-            # Get HTML content using browser service
-            html_content = await self.browser.get_html(product_url)
+            start_time = time.perf_counter()
 
-            # Parse with BeautifulSoup
-            soup = BeautifulSoup(html_content, "html.parser")
+            # Get HTML content using browser service (cached)
+            html_content = await self._cached_get_html(product_url)
 
-            # Extract product details
-            product = self._extract_product_details_from_soup(soup)
+            # Extract product details, memoized by page content
+            product = self._extract_product_details_memoized(html_content)
 
-            processing_time = asyncio.get_event_loop().time() - start_time
+            processing_time = time.perf_counter() - start_time
 
             return AmazonExtractionResult(
                 success=product is not None,
@@ -127,25 +401,23 @@ class AmazonCatalogParser(Parser):
             self.logger.error(f"❌ Product details failed: {e}")
             return AmazonExtractionResult(success=False, error=str(e))
 
-    def _extract_products_from_soup(self, soup) -> list:
-        """Extract products from soup using selectors."""
+    def _extract_products_from_html(self, html_content: str) -> list:
+        """Extract products from listing HTML as each container is parsed."""
         products = []
+        containers = 0
 
-        # Use working selector from original parser
-        containers = soup.find_all("div", {"data-component-type": "s-search-result"})
-        self.logger.info(f"Found {len(containers)} product containers")
-
-        for container in containers:
-            try:
-                product = self._extract_single_product_from_soup(container)
-                if product and product.asin:
-                    products.append(product)
-            except Exception as e:
-                self.logger.warning(f"Product extraction failed: {e}")
+        # Bind hot-loop lookups once; container count is unknown while streaming
+        extract = self._extract_single_product_from_tree
+        append = products.append
+        for containers, container in enumerate(_iter_search_results(html_content), 1):
+            product = extract(container)
+            if product is not None:
+                append(product)
 
+        self.logger.info(f"Found {containers} product containers")
         return products
 
-    def _extract_single_product_from_soup(self, container) -> dict:
+    def _extract_single_product_from_tree(self, container) -> dict:
         """Extract single product from container."""
         try:
             # Extract ASIN
@@ -153,214 +425,79 @@ class AmazonCatalogParser(Parser):
             if not asin:
                 return None
 
-            # Extract title
-            title = self._extract_title_from_soup(container)
-
-            # Extract price
-            price = self._extract_price_from_soup(container)
-
-            # Extract rating
-            rating = self._extract_rating_from_soup(container)
-
-            # Extract image
-            image_url = self._extract_image_from_soup(container)
-
-            # Extract additional data
-            review_count = self._extract_review_count_from_soup(container)
-            availability = self._extract_availability_from_soup(container)
-            prime_eligible = self._extract_prime_eligible_from_soup(container)
+            # Fill all listing fields from the fallback selector table
+            fields = _extract_fields(container)
 
             # Build product URL
             product_url = f"https://www.amazon.com/dp/{asin}" if asin else None
 
-            # Create proper Pydantic objects
+            # Build models without validation: every field comes from our own
+            # extractors, so pydantic's validator chain is pure overhead here
             price_obj = None
-            if price:
-                try:
-                    # Extract numeric value from price string
-                    price_match = re.search(
-                        r"[\d,]+\.?\d*", price.replace("$", "").replace(",", "")
+            if fields["price"]:
+                # Extract numeric value from price string
+                price_match = PRICE_RE.search(
+                    fields["price"].translate(PRICE_STRIP_TABLE)
+                )
+                if price_match is not None:
+                    price_obj = AmazonPrice.model_construct(
+                        current=float(price_match.group()), currency="USD"
                     )
-                    if price_match:
-                        price_value = float(price_match.group().replace(",", ""))
-                        price_obj = AmazonPrice(current=price_value, currency="USD")
-                except:
-                    pass
 
             rating_obj = None
-            if rating:
-                rating_obj = AmazonRating(rating=rating, review_count=review_count)
+            if fields["rating"]:
+                rating_obj = AmazonRating.model_construct(
+                    rating=fields["rating"], review_count=fields["review_count"]
+                )
 
             image_obj = None
-            if image_url:
-                image_obj = AmazonImage(url=image_url, is_primary=True)
+            if fields["image"]:
+                image_obj = AmazonImage.model_construct(
+                    url=fields["image"], is_primary=True
+                )
 
-            return AmazonProduct(
+            return AmazonProduct.model_construct(
                 asin=asin,
-                title=title or f"Product {asin}",
+                title=fields["title"] or f"Product {asin}",
                 price=price_obj,
                 rating=rating_obj,
-                availability=availability,
-                images=[image_obj] if image_obj else [],
+                availability=fields["availability"],
+                images=(image_obj,) if image_obj else (),
+                # Passed explicitly: resolving a default_factory in
+                # model_construct inspects its signature on every call
+                specifications={},
                 url=product_url or f"https://www.amazon.com/dp/{asin}",
-                prime_eligible=prime_eligible,
+                prime_eligible=fields["prime"],
             )
 
         except Exception as e:
             self.logger.warning(f"Single product extraction failed: {e}")
             return None
 
-    def _extract_title_from_soup(self, container):
-        """Extract title using selectors from original parser."""
-        selectors = [
-            "h2.a-size-medium a span",
-            ".s-line-clamp-2 span",
-            "h2 span",
-            ".a-link-normal .a-text-normal span",
-            "h2 a span",
-            "h2 a",  # Fallback for direct link
-            ".a-size-medium.a-color-base.a-text-normal",  # Direct text
-        ]
-
-        for selector in selectors:
-            try:
-                element = container.select_one(selector)
-                if element and element.get_text(strip=True):
-                    return element.get_text(strip=True)
-            except:
-                continue
-        return None
-
-    def _extract_price_from_soup(self, container):
-        """Extract price using selectors from original parser."""
-        selectors = [
-            ".a-price .a-offscreen",
-            ".a-price-whole",
-            ".puis-price-instructions-style .a-price",
-            ".a-price-range .a-offscreen",  # Price range
-            ".a-price .a-price-whole",  # Whole price
-            ".a-price .a-price-fraction",  # Fraction part
-        ]
-
-        for selector in selectors:
-            try:
-                element = container.select_one(selector)
-                if element and element.get_text(strip=True):
-                    return element.get_text(strip=True)
-            except:
-                continue
-        return None
-
-    def _extract_rating_from_soup(self, container):
-        """Extract rating using selectors from original parser."""
-        selectors = [
-            ".a-icon-star-mini .a-icon-alt",
-            ".a-icon-star .a-icon-alt",
-            ".a-popover-trigger .a-icon-alt",
-            ".a-icon-alt",  # General star icon
-            ".a-star-mini .a-icon-alt",  # Mini star
-        ]
-
-        for selector in selectors:
-            try:
-                element = container.select_one(selector)
-                if element:
-                    aria_label = element.get("aria-label")
-                    if aria_label:
-                        # Extract rating from "4.5 out of 5 stars" format
-                        match = re.search(r"(\d+\.?\d*)", aria_label)
-                        if match:
-                            return float(match.group(1))
-            except:
-                continue
-        return None
-
-    def _extract_image_from_soup(self, container):
-        """Extract image URL using selectors from original parser."""
-        selectors = [
-            ".s-image",
-            ".s-product-image-container img",
-            "img.s-image",
-            ".s-image-container img",  # Alternative container
-            "img[data-image-latency]",  # Data attribute
-        ]
-
-        for selector in selectors:
-            try:
-                element = container.select_one(selector)
-                if element and element.get("src"):
-                    return element.get("src")
-            except:
-                continue
-        return None
-
-    def _extract_review_count_from_soup(self, container):
-        """Extract review count from container."""
-        selectors = [
-            ".s-link-style .a-size-base",
-            ".a-size-base.s-link-style",
-            ".a-size-base",
-            ".a-link-normal .a-size-base",
-        ]
-
-        for selector in selectors:
-            try:
-                element = container.select_one(selector)
-                if element:
-                    text = element.get_text(strip=True)
-                    # Extract number from text like "1,234" or "1,234 reviews"
-                    match = re.search(r"([\d,]+)", text)
-                    if match:
-                        return int(match.group(1).replace(",", ""))
-            except:
-                continue
-        return None
-
-    def _extract_availability_from_soup(self, container):
-        """Extract availability status."""
-        selectors = [
-            ".a-size-base.a-color-secondary",
-            ".a-size-base.a-color-price",
-            ".a-color-secondary",
-        ]
-
-        for selector in selectors:
-            try:
-                element = container.select_one(selector)
-                if element:
-                    text = element.get_text(strip=True)
-                    if text and len(text) < 50:  # Avoid long descriptions
-                        return text
-            except:
-                continue
-        return None
-
-    def _extract_prime_eligible_from_soup(self, container):
-        """Check if product is Prime eligible."""
-        prime_selectors = [
-            ".a-icon-prime",
-            ".s-prime",
-            "[data-prime]",
-        ]
-
-        for selector in prime_selectors:
-            try:
-                element = container.select_one(selector)
-                if element:
-                    return True
-            except:
-                continue
-        return False
-
-    def _extract_product_details_from_soup(self, soup):
+    def _extract_product_details_memoized(self, html_content: str):
+        """Extract product details, reusing results for identical page HTML."""
+        key = hash(html_content)
+        product = self._details_memo.get(key)
+        if product is not None:
+            self._details_memo.move_to_end(key)
+            return dict(product)
+
+        # Parse with lxml
+        tree = lxml.html.document_fromstring(html_content)
+        product = self._extract_product_details_from_tree(tree)
+        if product is not None:
+            self._details_memo[key] = dict(product)
+            while len(self._details_memo) > self.DETAILS_MEMO_SIZE:
+                self._details_memo.popitem(last=False)
+
+        return product
+
+    def _extract_product_details_from_tree(self, tree):
         """Extract product details from product page."""
         try:
             # Extract basic product info
-            title_elem = soup.select_one("#productTitle")
-            title = title_elem.get_text(strip=True) if title_elem else None
-
-            price_elem = soup.select_one(".a-price .a-offscreen")
-            price = price_elem.get_text(strip=True) if price_elem else None
+            title = _first_match(tree, DETAILS_TITLE_SELECTORS, _text)
+            price = _first_match(tree, DETAILS_PRICE_SELECTORS, _text)
 
             return {"title": title, "price": price, "page_type": "product_details"}
         except Exception as e:
@@ -370,11 +507,10 @@ class AmazonCatalogParser(Parser):
     async def parse(self) -> Dict[str, Any]:
         """Default parse method for scheduled execution."""
         try:
-            # Default search query
+            # Default search query from config.env
             # https://www.amazon.com/s?k=laptop&page=1
-            
-            query = "laptop"
-            result = await self.search_products(query, max_pages=1)
+            query = self._default_query
+            result = await self.search_products(query, max_pages=self._max_pages)
 
             return {
                 "success": result.success,
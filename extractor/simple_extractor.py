@@ -6,11 +6,13 @@ Just extract Amazon products. No bloat, no bullshit.
 
 import asyncio
 import sys
+from functools import lru_cache
 from pathlib import Path
+from urllib.parse import quote_plus, unquote_plus, urlparse
 
 
 from unrealon_driver.src.core.parser import Parser
-from amazon_config import amazon_config, parser_instance_config
+from amazon_config import get_amazon_config, parser_instance_config
 
 test_url = "https://www.amazon.com/s?k=laptop"
 
@@ -23,7 +25,7 @@ class SimpleExtractor(Parser):
         super().__init__(
             parser_id=parser_instance_config.parser_id,
             parser_name="Amazon Simple Extractor",
-            config=amazon_config,  # Pass the whole extended config!
+            config=get_amazon_config(),  # Pass the whole extended config!
         )
 
     async def setup(self):
@@ -78,24 +80,35 @@ class SimpleExtractor(Parser):
 
 
 # Utility functions
+# Query parameters kept by clean_amazon_url, in output order
+_ESSENTIAL_PARAMS = ("k", "i", "bbn", "rh", "node", "page")
+
+
+@lru_cache(maxsize=4096)
 def clean_amazon_url(url: str) -> str:
     """Remove tracking garbage from Amazon URLs."""
-    from urllib.parse import urlparse, parse_qs, urlencode
+    if "amazon.com" not in url:
+        return url
 
     parsed = urlparse(url)
     if "amazon.com" not in parsed.netloc:
         return url
 
-    params = parse_qs(parsed.query)
+    # Single pass over the raw query, first value wins (like parse_qs()[0]);
+    # kept values are normalized the way parse_qs + urlencode did
     essential = {}
-    for param in ["k", "i", "bbn", "rh", "node", "page"]:
-        if param in params:
-            essential[param] = params[param][0]
+    for pair in parsed.query.split("&"):
+        name, _, value = pair.partition("=")
+        if value and name in _ESSENTIAL_PARAMS and name not in essential:
+            essential[name] = quote_plus(unquote_plus(value))
 
-    clean_query = urlencode(essential) if essential else ""
     clean_url = f"{parsed.scheme}://{parsed.netloc}{parsed.path}"
-    if clean_query:
-        clean_url += f"?{clean_query}"
+    if essential:
+        clean_url += "?" + "&".join(
+            f"{param}={essential[param]}"
+            for param in _ESSENTIAL_PARAMS
+            if param in essential
+        )
 
     return clean_url
 